@@ -4,11 +4,13 @@ It allows filtering videos by date or title.
 
 Modules:
     requests: To make HTTP requests to fetch YouTube page source code and RSS feed content.
-    bs4 (BeautifulSoup): To parse HTML and XML content.
+    bs4 (BeautifulSoup): The type of the parsed feed entries filter_videos also accepts.
+    xml.etree.ElementTree: To incrementally parse the RSS feed.
     re: To perform regular expression matching.
     argparse: To handle command-line arguments.
     datetime: To handle date and time operations.
     pyperclip: To copy the RSS feed URL to the clipboard.
+    orjson (optional): To read and write the cache file faster than the json module.
 
 Functions:
     get_youtube_source_code(youtube_url): Fetches the source code of a YouTube page.
@@ -16,6 +18,7 @@ Functions:
     create_rss_feed_url(channel_id): Creates the RSS feed URL from the channel ID.
     fetch_rss_feed_content(rss_feed_url, limit=5): Fetches and parses the RSS feed content.
     filter_videos(entries, filter_by=None, filter_value=None): Filters videos.
+    stream_filtered_videos(feed_url, limit=5, ...): Fetches and filters the latest videos in one pass.
 
 Usage:
     python main.py <youtube_url> [--filter_by <filter_by>] [--filter_value <filter_value>]
@@ -28,150 +31,438 @@ Example:
     --filter_value 2023-10-01
 """
 
+from __future__ import annotations
+
 __version__ = "1.0.0"
 
 import re
 import argparse
+import atexit
+import gzip
 import json
-import csv
+import io
+import os
 import sys
-import time
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from datetime import datetime
-import requests
-from bs4 import BeautifulSoup, FeatureNotFound, ResultSet, PageElement, Tag, NavigableString
-import pyperclip
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+# requests, bs4, csv, pyperclip and concurrent.futures are imported where they are used, so that
+# --version, --clear-cache and similar paths don't pay for importing them
+if TYPE_CHECKING:
+    import requests
+    from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    """
+    Parse JSON, using orjson when it is installed.
+
+    Args:
+        data (bytes): The JSON document.
+
+    Returns:
+        The parsed object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-def get_cache_file_path() -> Path:
+def _json_dumps(obj) -> bytes:
+    """
+    Serialize an object to indented JSON, using orjson when it is installed.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # Write non-ASCII characters as UTF-8 like orjson, rather than as \u escapes
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def get_cache_file_path(compressed: bool | None = None) -> Path:
     """
     Get the path to the cache file for storing channel ID mappings.
 
+    Args:
+        compressed (bool | None): Whether to get the path of the gzipped (True) or
+            plain (False) cache file. By default, the existing file is returned, or
+            the newer one if a save was interrupted before the other was removed.
+
     Returns:
         Path: The path to the cache file.
     """
     cache_dir = Path.home() / ".youtuberss"
     cache_dir.mkdir(exist_ok=True)
-    return cache_dir / "cache.json"
+    plain_file = cache_dir / "cache.json"
+    gzip_file = cache_dir / "cache.json.gz"
+    if compressed is None:
+        existing = [f for f in (plain_file, gzip_file) if f.exists()]
+        return max(existing, key=lambda f: f.stat().st_mtime) if existing else plain_file
+    return gzip_file if compressed else plain_file
+
+
+# Cache files larger than this (in bytes) are stored gzipped
+CACHE_COMPRESS_THRESHOLD = 64 * 1024
 
 
-def load_cache() -> dict:
+# Cached channel IDs older than this are treated as missing and refetched
+DEFAULT_CACHE_TTL_DAYS = 30
+
+# URLs whose page had no channel ID are remembered for a shorter time
+NEGATIVE_CACHE_TTL_DAYS = 1
+
+# Returned by get_cached_channel_id() for URLs known to have no channel ID
+NEGATIVE = object()
+
+# Maximum number of URLs kept in the cache; the least recently used are evicted first
+MAX_CACHE_ENTRIES = 1024
+
+# In-process copy of the cache file, loaded lazily and flushed once at exit.
+# _CACHE_LOCK guards it when URLs are processed in parallel (--urls-file).
+_CACHE: OrderedDict | None = None
+_CACHE_DIRTY = False
+_CACHE_LOCK = threading.RLock()
+
+# Small direct-mapped table of recent cache hits, indexed by hash(url) % LAST_HIT_SLOTS.
+# Each slot holds (url, max_age_days, result, expires_at), so a repeated lookup skips
+# the cache dict and the timestamp parsing.
+LAST_HIT_SLOTS = 512
+_LAST_HIT: list[tuple[str, int, str | object, datetime] | None] = [None] * LAST_HIT_SLOTS
+
+
+def _forget_last_hit(url: str) -> None:
+    """
+    Remove a URL from the table of recent cache hits.
+
+    Args:
+        url (str): The YouTube URL.
+    """
+    slot = hash(url) & (LAST_HIT_SLOTS - 1)
+    last_hit = _LAST_HIT[slot]
+    if last_hit is not None and last_hit[0] == url:
+        _LAST_HIT[slot] = None
+
+
+def load_cache() -> OrderedDict:
     """
     Load the cache from the cache file.
 
+    The file stores entries from least to most recently used.
+
     Returns:
-        dict: The cached channel ID mappings.
+        OrderedDict: The cached channel ID mappings.
     """
     cache_file = get_cache_file_path()
     if cache_file.exists():
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+            opener = gzip.open if cache_file.suffix == ".gz" else open
+            with opener(cache_file, "rb") as f:
+                return OrderedDict(_json_loads(f.read()))
+        except (IOError, EOFError, TypeError, ValueError):
+            return OrderedDict()
+    return OrderedDict()
 
 
-def save_cache(cache: dict) -> None:
+def save_cache(cache: OrderedDict) -> None:
     """
     Save the cache to the cache file.
 
+    The cache is written to a temporary file first and then moved into place,
+    so an interrupted write never leaves a corrupted cache file behind. Caches
+    larger than CACHE_COMPRESS_THRESHOLD are gzipped, replacing the plain file.
+
     Args:
-        cache (dict): The cache to save.
+        cache (OrderedDict): The cache to save.
     """
-    cache_file = get_cache_file_path()
+    # orjson writes an OrderedDict in insertion order, ignoring move_to_end(), so
+    # copy it into a plain dict, which keeps the least to most recently used order
+    data = _json_dumps(dict(cache))
+    compressed = len(data) > CACHE_COMPRESS_THRESHOLD
+    cache_file = get_cache_file_path(compressed)
+    stale_file = get_cache_file_path(not compressed)
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
     try:
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(cache, f, indent=2)
-    except IOError as e:
+        if compressed:
+            # Level 1 gets most of the size reduction for very little CPU time
+            with gzip.open(tmp_file, "wb", compresslevel=1) as f:
+                f.write(data)
+        else:
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+        os.replace(tmp_file, cache_file)
+        if stale_file.exists():
+            stale_file.unlink()
+    except OSError as e:
         print(f"Warning: Could not save cache: {e}")
 
 
-def get_cached_channel_id(url: str, use_cache: bool = True) -> str | None:
+def _get_cache() -> OrderedDict:
+    """
+    Get the shared in-process cache, loading it from disk on first use.
+
+    Returns:
+        OrderedDict: The cached channel ID mappings.
+    """
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = load_cache()
+        return _CACHE
+
+
+def _flush_cache() -> None:
+    """
+    Write the in-process cache back to disk if it has been modified.
+    """
+    global _CACHE_DIRTY
+    with _CACHE_LOCK:
+        if _CACHE is not None and _CACHE_DIRTY:
+            save_cache(_CACHE)
+            _CACHE_DIRTY = False
+
+
+atexit.register(_flush_cache)
+
+
+def _mark_used(cache: OrderedDict, url: str) -> None:
+    """
+    Move a URL to the most recently used end of the cache.
+
+    The cache is only marked as modified if this changes its order, so repeated
+    lookups of the same URL don't cause a write at exit.
+
+    Args:
+        cache (OrderedDict): The cached channel ID mappings.
+        url (str): The YouTube URL, which must be in the cache.
+    """
+    global _CACHE_DIRTY
+    if next(reversed(cache)) != url:
+        cache.move_to_end(url)
+        _CACHE_DIRTY = True
+
+
+def get_cached_channel_id(
+    url: str, use_cache: bool = True, max_age_days: int = DEFAULT_CACHE_TTL_DAYS
+) -> str | object | None:
     """
     Get a cached channel ID for a URL if available.
 
+    Entries older than `max_age_days` are removed from the cache and treated as missing.
+    URLs cached as having no channel ID expire after NEGATIVE_CACHE_TTL_DAYS (or
+    `max_age_days`, if that is shorter).
+
     Args:
         url (str): The YouTube URL.
         use_cache (bool): Whether to use the cache.
+        max_age_days (int): Maximum age of a cache entry in days (default: 30).
 
     Returns:
-        str | None: The cached channel ID if available, None otherwise.
+        str | object | None: The cached channel ID if available, NEGATIVE if the URL is
+            known to have no channel ID, None otherwise.
     """
+    global _CACHE_DIRTY
     if not use_cache:
         return None
-    
-    cache = load_cache()
-    cache_entry = cache.get(url)
-    if cache_entry:
-        # Check if cache entry has timestamp and channel_id
+
+    slot = hash(url) & (LAST_HIT_SLOTS - 1)
+    with _CACHE_LOCK:
+        # Fast path: a recent hit for the same URL and TTL that hasn't expired yet. It is
+        # read under the lock, so another thread can't evict or replace the URL meanwhile
+        last_hit = _LAST_HIT[slot]
+        if last_hit is not None and last_hit[0] == url and last_hit[1] == max_age_days:
+            if datetime.now() <= last_hit[3]:
+                _mark_used(_CACHE, url)
+                return last_hit[2]
+
+        cache = _get_cache()
+        cache_entry = cache.get(url)
+        if not cache_entry:
+            return None
+        # Entries without a timestamp, including the legacy format (just the channel ID
+        # as a string), can't be aged, so they are treated as expired
+        expired = True
         if isinstance(cache_entry, dict) and "channel_id" in cache_entry:
-            return cache_entry["channel_id"]
-        # Legacy cache format (just the channel ID as a string)
-        return cache_entry
-    return None
+            negative = cache_entry.get("negative", False)
+            if negative:
+                max_age = timedelta(days=min(max_age_days, NEGATIVE_CACHE_TTL_DAYS))
+            else:
+                max_age = timedelta(days=max_age_days)
+            try:
+                expires_at = datetime.fromisoformat(cache_entry["timestamp"]) + max_age
+                expired = datetime.now() > expires_at
+            except (KeyError, TypeError, ValueError):
+                pass
+        if expired:
+            del cache[url]
+            _forget_last_hit(url)
+            _CACHE_DIRTY = True
+            return None
+        _mark_used(cache, url)
+        result = NEGATIVE if negative else cache_entry["channel_id"]
+        _LAST_HIT[slot] = (url, max_age_days, result, expires_at)
+        return result
 
 
-def cache_channel_id(url: str, channel_id: str) -> None:
+def cache_channel_id(url: str, channel_id: str | None) -> None:
     """
     Cache a channel ID for a URL.
 
+    A channel ID of None records that the URL's page has no channel ID, so it
+    isn't fetched again until the entry expires.
+
+    The entry is kept in memory and written to disk when the program exits.
+    Once the cache holds more than MAX_CACHE_ENTRIES URLs, the least recently
+    used entries are evicted.
+
     Args:
         url (str): The YouTube URL.
-        channel_id (str): The channel ID.
+        channel_id (str | None): The channel ID, or None if the page has none.
     """
-    cache = load_cache()
-    cache[url] = {
-        "channel_id": channel_id,
-        "timestamp": datetime.now().isoformat()
-    }
-    save_cache(cache)
+    global _CACHE_DIRTY
+    with _CACHE_LOCK:
+        cache = _get_cache()
+        cache_entry = {
+            "channel_id": channel_id,
+            "timestamp": datetime.now().isoformat()
+        }
+        if channel_id is None:
+            cache_entry["negative"] = True
+        cache[url] = cache_entry
+        cache.move_to_end(url)
+        _forget_last_hit(url)
+        while len(cache) > MAX_CACHE_ENTRIES:
+            evicted_url, _ = cache.popitem(last=False)
+            _forget_last_hit(evicted_url)
+        _CACHE_DIRTY = True
 
 
 def clear_cache() -> None:
     """
     Clear the cache file.
     """
-    cache_file = get_cache_file_path()
-    if cache_file.exists():
-        cache_file.unlink()
-        print(f"Cache cleared: {cache_file}")
-    else:
+    global _CACHE, _CACHE_DIRTY
+    with _CACHE_LOCK:
+        _CACHE = None
+        _CACHE_DIRTY = False
+        _LAST_HIT[:] = [None] * LAST_HIT_SLOTS
+    cleared = False
+    for cache_file in (get_cache_file_path(compressed=False), get_cache_file_path(compressed=True)):
+        if cache_file.exists():
+            cache_file.unlink()
+            print(f"Cache cleared: {cache_file}")
+            cleared = True
+    if not cleared:
         print("No cache file to clear.")
 
 
-def retry_request(func, *args, max_retries=3, backoff_factor=2, **kwargs):
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all requests.
+
+    Reusing one session keeps connections to YouTube alive between requests,
+    so only the first request pays for the TCP and TLS handshake.
+
+    Timeouts, connection errors, rate limiting (429) and server errors (5xx) are
+    retried with exponential backoff and random jitter, honouring Retry-After.
+    Once the retries are used up the last error response is returned, so callers
+    still see it through `raise_for_status()`.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        backoff_jitter=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = f"YoutubeChannel2rss/{__version__}"
+    return session
+
+
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
     """
-    Retry a function with exponential backoff.
+    Get the shared HTTP session, creating it on first use.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _create_session()
+                atexit.register(_SESSION.close)
+    return _SESSION
+
+
+# Matches the YouTube channel URL forms the channel ID can be found for
+_YT_URL_RE = re.compile(
+    r"^https?://(www\.)?(youtube\.com|youtu\.be)/(channel/UC[\w-]+|@[\w.-]+|c/[\w.-]+|user/[\w.-]+)/?"
+)
+
+
+def is_youtube_channel_url(url: str) -> bool:
+    """
+    Checks whether a URL looks like a YouTube channel URL, without any network I/O.
 
     Args:
-        func: The function to retry.
-        max_retries: Maximum number of retry attempts (default: 3).
-        backoff_factor: Multiplier for exponential backoff (default: 2).
-        *args, **kwargs: Arguments to pass to the function.
+        url (str): The URL to check.
 
     Returns:
-        The result of the function if successful, None otherwise.
+        bool: True for /channel/UC..., @handle, c/ and user/ URLs, False otherwise.
     """
-    for attempt in range(max_retries):
-        try:
-            result = func(*args, **kwargs)
-            return result
-        except requests.exceptions.Timeout:
-            if attempt < max_retries - 1:
-                wait_time = backoff_factor ** attempt
-                print(f"Timeout. Retrying in {wait_time} seconds... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
-            else:
-                raise
-        except requests.exceptions.ConnectionError:
-            if attempt < max_retries - 1:
-                wait_time = backoff_factor ** attempt
-                print(f"Connection error. Retrying in {wait_time} seconds... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
-            else:
-                raise
-    return None
+    return _YT_URL_RE.match(url) is not None
+
+
+# Matches the channel ID in the path of a youtube.com/channel/UC... URL
+_CHANNEL_URL_RE = re.compile(r"https?://(?:www\.)?youtube\.com/channel/(UC[\w-]+)")
+
+
+def get_channel_id_from_url(url: str) -> str | None:
+    """
+    Extracts the channel ID directly from a /channel/UC... URL.
+
+    Only @handle, c/ and user/ URLs need their page fetched to find the channel ID.
+
+    Args:
+        url (str): The YouTube channel URL.
+
+    Returns:
+        str: The channel ID if the URL is a /channel/ URL, None otherwise.
+    """
+    match = _CHANNEL_URL_RE.match(url)
+    return match.group(1) if match else None
 
 
 def get_youtube_source_code(url: str) -> bytes | None:
@@ -185,13 +476,12 @@ def get_youtube_source_code(url: str) -> bytes | None:
         bytes: The content of the YouTube page if the request is successful.
         None: If there is an error fetching the URL.
     """
-    def _fetch():
-        response = requests.get(url, timeout=10)
+    import requests
+
+    try:
+        response = _get_session().get(url, timeout=10)
         response.raise_for_status()
         return response.content
-    
-    try:
-        return retry_request(_fetch)
     except requests.exceptions.Timeout:
         print(f"Error: Request timed out while fetching URL: {url}")
         print("Suggestion: Check your internet connection or try again later.")
@@ -213,10 +503,24 @@ def get_youtube_source_code(url: str) -> bytes | None:
         return None
 
 
+# Matches the og:url meta tag directly on the raw bytes, whatever its attribute order and quotes
+_OG_URL_META_RE = re.compile(rb"<meta\b[^>]*\bproperty\s*=\s*[\"']og:url[\"'][^>]*>", re.IGNORECASE)
+
+# Matches the channel ID in the content attribute of a meta tag matched by _OG_URL_META_RE
+_META_CONTENT_CHANNEL_RE = re.compile(
+    rb"\bcontent\s*=\s*[\"'][^\"']*/channel/([UC][a-zA-Z0-9_-]+)", re.IGNORECASE
+)
+
+# Matches the channel ID embedded in the page's inline script data (e.g. ytInitialData)
+_SCRIPT_CHANNEL_ID_RE = re.compile(rb"\"(?:channel_id|channelId)\":\"([UC][a-zA-Z0-9_-]+)\"")
+
 def get_youtube_channel_id(html_source_code: bytes | None) -> str | None:
     """
     Extracts the channel ID from the YouTube source code.
 
+    The og:url meta tag and the inline script data are matched with regular expressions
+    on the raw page, so the page is never parsed into a DOM.
+
     Args:
         html_source_code (bytes): The HTML source code of the YouTube page.
 
@@ -226,33 +530,17 @@ def get_youtube_channel_id(html_source_code: bytes | None) -> str | None:
     if html_source_code is None:
         return None
 
-    soup = BeautifulSoup(html_source_code, "html.parser")
-
     # Method 1: Meta tag (most reliable)
-    meta_tag = soup.find("meta", property="og:url")
+    meta_tag = _OG_URL_META_RE.search(html_source_code)
     if meta_tag:
-        og_url = meta_tag.get("content")
-        # Support both /channel/ and /@handle URLs
-        match = re.search(r"/channel/([UC][a-zA-Z0-9_-]+)", og_url)
+        match = _META_CONTENT_CHANNEL_RE.search(meta_tag.group(0))
         if match:
-            return match.group(1)
-        # Check if this is a handle URL - the channel ID might be elsewhere
-        handle_match = re.search(r"/@([a-zA-Z0-9_-]+)", og_url)
-        if handle_match:
-            # Continue to other methods to find the actual channel ID
-            pass
-
-    # Method 2: Script tags (fallback)
-    script_tags = soup.find_all("script")
-    for script in script_tags:
-        script_content = str(script)
-        match = re.search(r"\"channel_id\":\"([UC][a-zA-Z0-9_-]+)\"", script_content)
-        if match:
-            return match.group(1)
-        # Also look for channelId pattern
-        match = re.search(r"\"channelId\":\"([UC][a-zA-Z0-9_-]+)\"", script_content)
-        if match:
-            return match.group(1)
+            return match.group(1).decode()
+
+    # Method 2: Script data, scanned once over the whole page (handle URLs end up here)
+    match = _SCRIPT_CHANNEL_ID_RE.search(html_source_code)
+    if match:
+        return match.group(1).decode()
 
     return None
 
@@ -272,39 +560,96 @@ def create_rss_feed_url(cid: str) -> str | None:
     return None
 
 
-def fetch_rss_feed_content(
-    feed_url: str, limit: int = 5
-) -> ResultSet[PageElement | Tag | NavigableString] | None:
+# Keys of the dictionaries returned by fetch_rss_feed_content
+_ENTRY_FIELDS = ("title", "published", "link", "duration_seconds")
+
+
+def _local_name(tag: str) -> str:
     """
-    Fetches and parses the RSS feed content, limited to the latest videos.
+    Strips the namespace from an ElementTree tag (e.g. '{http://www.w3.org/2005/Atom}entry').
+
+    Args:
+        tag (str): The tag name, optionally prefixed with a namespace.
+
+    Returns:
+        str: The tag name without its namespace.
+    """
+    return tag.rpartition("}")[2]
+
+
+def _read_entry(entry: ET.Element) -> tuple[str, str, str, int | None]:
+    """
+    Extracts the video details from a parsed feed 'entry' element.
+
+    Args:
+        entry (ET.Element): The 'entry' element.
+
+    Returns:
+        tuple: The title, published date, link and duration in seconds (None if unavailable).
+    """
+    title = published = link = ""
+    duration_seconds = None
+    for child in entry:
+        name = _local_name(child.tag)
+        if name == "title":
+            title = child.text or ""
+        elif name == "published":
+            published = child.text or ""
+        elif name == "link":
+            link = child.get("href", "")
+        elif name == "group":
+            # media:group/media:content carries the duration when the feed provides it
+            for media in child:
+                if _local_name(media.tag) == "content" and media.get("duration"):
+                    duration_seconds = int(media.get("duration"))
+    return title, published, link, duration_seconds
+
+
+def _iter_feed_entries(stream, limit: int) -> Iterator[tuple[str, str, str, int | None]]:
+    """
+    Incrementally parses a feed and yields its first `limit` entries.
+
+    Parsing stops as soon as `limit` entries have been read, so the rest of the
+    feed is never downloaded or parsed.
+
+    Args:
+        stream: A file-like object with the raw feed XML.
+        limit (int): The maximum number of entries to yield.
+
+    Yields:
+        tuple: The video details of each entry, see `_read_entry`.
+    """
+    if limit <= 0:
+        return
+    count = 0
+    for _, elem in ET.iterparse(stream, events=("end",)):
+        if _local_name(elem.tag) != "entry":
+            continue
+        yield _read_entry(elem)
+        elem.clear()
+        count += 1
+        if count >= limit:
+            break
+
+
+def _open_rss_feed(feed_url: str) -> requests.Response | None:
+    """
+    Requests the RSS feed and returns the response with its body still unread.
 
     Args:
         feed_url (str): The URL of the RSS feed.
-        limit (int, optional): The maximum number of videos to fetch. Defaults to 5.
 
     Returns:
-        list: A list of BeautifulSoup 'entry' elements representing the videos if successful.
-        None: If there is an error fetching the RSS feed or parsing the content.
+        requests.Response: The streaming response if the request is successful.
+        None: If there is an error fetching the RSS feed.
     """
-    def _fetch():
-        response = requests.get(feed_url, timeout=10)
-        response.raise_for_status()
-        return response.content
-    
+    import requests
+
     try:
-        content = retry_request(_fetch)
-        if content is None:
-            return None
-        try:
-            soup = BeautifulSoup(content, "xml")
-        except FeatureNotFound:
-            print(
-                "Error: Couldn't find a tree builder with the features you requested: xml."
-                " Please install the 'lxml' parser library using 'pip install lxml'."
-            )
-            return None
-        _entries = soup.find_all("entry")[:limit]
-        return _entries
+        response = _get_session().get(feed_url, stream=True, timeout=10)
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return response
     except requests.exceptions.Timeout:
         print(f"Error: Request timed out while fetching RSS feed: {feed_url}")
         print("Suggestion: Check your internet connection or try again later.")
@@ -324,8 +669,65 @@ def fetch_rss_feed_content(
         return None
 
 
-def filter_videos(
-    param_entries: list[BeautifulSoup],
+def fetch_rss_feed_content(
+    feed_url: str, limit: int = 5
+) -> list[dict[str, str | int | None]] | None:
+    """
+    Fetches and parses the RSS feed content, limited to the latest videos.
+
+    Args:
+        feed_url (str): The URL of the RSS feed.
+        limit (int, optional): The maximum number of videos to fetch. Defaults to 5.
+
+    Returns:
+        list: A list of dictionaries with the 'title', 'published', 'link' and
+            'duration_seconds' of each video if successful.
+        None: If there is an error fetching the RSS feed or parsing the content.
+    """
+    response = _open_rss_feed(feed_url)
+    if response is None:
+        return None
+    with response:
+        try:
+            return [dict(zip(_ENTRY_FIELDS, values)) for values in _iter_feed_entries(response.raw, limit)]
+        except ET.ParseError as e:
+            print(f"Error: Could not parse RSS feed: {e}")
+            return None
+
+
+def _entry_fields(entry: dict | BeautifulSoup) -> tuple[str, str, str, int | None]:
+    """
+    Reads the title, published date, link and duration of a feed entry.
+
+    Args:
+        entry (dict | BeautifulSoup): An entry from `fetch_rss_feed_content` or a
+            BeautifulSoup 'entry' element.
+
+    Returns:
+        tuple: The title, published date, link and duration in seconds (None if unavailable).
+    """
+    if isinstance(entry, dict):
+        return entry["title"], entry["published"], entry["link"], entry.get("duration_seconds")
+
+    title = entry.find("title").text
+    published = entry.find("published").text
+    link = entry.find("link")["href"]
+
+    # Extract duration from media:group if available
+    duration_seconds = None
+    media_group = entry.find("media:group")
+    if media_group:
+        media_content = media_group.find("media:content")
+        if media_content and media_content.get("duration"):
+            duration_seconds = int(media_content.get("duration"))
+    return title, published, link, duration_seconds
+
+
+# Matches the YYYY-MM-DD date at the start of an entry's ISO-8601 published timestamp
+_PUBLISHED_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}T")
+
+
+def _make_video_filter(
     filter_by: str | None = None,
     filter_value: str | None = None,
     after_date: str | None = None,
@@ -333,104 +735,86 @@ def filter_videos(
     min_duration: int | None = None,
     max_duration: int | None = None,
     include_duration: bool = False,
-) -> list[dict[str, str]]:
+):
     """
-    Filters videos by date, title, duration, or other metadata.
+    Validates the filter criteria and builds the function that applies them to a single video.
     Multiple filters are combined using AND logic.
 
     Args:
-        param_entries (list): A list of BeautifulSoup 'entry' elements representing the videos.
-        filter_by (str, optional): The criteria to filter videos by ('date' or 'title').
-        filter_value (str, optional): The value to filter videos by. Defaults to None.
-        after_date (str, optional): Filter videos published after this date (YYYY-MM-DD).
-        before_date (str, optional): Filter videos published before this date (YYYY-MM-DD).
-        min_duration (int, optional): Filter videos with minimum duration in seconds.
-        max_duration (int, optional): Filter videos with maximum duration in seconds.
-        include_duration (bool): Whether to include duration in the output.
+        See `filter_videos`.
 
     Returns:
-        list: A list of dictionaries containing filtered video details.
+        A function taking a video's title, published date, link and duration in seconds,
+        which returns the video details as a dictionary if the video passes all filters
+        and None otherwise. None if one of the filter values is invalid.
     """
-    filtered_videos = []
-    
-    # Parse date range if provided with error handling
-    after_dt = None
-    before_dt = None
+    # Validate the dates once and normalize them to YYYY-MM-DD, so entries can be
+    # compared against them as strings (ISO-8601 dates sort lexically)
+    after_day = None
+    before_day = None
+    filter_date = None
     
     if after_date:
         try:
-            after_dt = datetime.strptime(after_date, "%Y-%m-%d").date()
+            after_day = datetime.strptime(after_date, "%Y-%m-%d").date().isoformat()
         except ValueError:
             print(f"Error: Invalid date format for --after: {after_date}")
             print("Suggestion: Use YYYY-MM-DD format (e.g., 2023-10-01)")
-            return []
+            return None
     
     if before_date:
         try:
-            before_dt = datetime.strptime(before_date, "%Y-%m-%d").date()
+            before_day = datetime.strptime(before_date, "%Y-%m-%d").date().isoformat()
         except ValueError:
             print(f"Error: Invalid date format for --before: {before_date}")
             print("Suggestion: Use YYYY-MM-DD format (e.g., 2023-10-31)")
-            return []
-    
-    for entry in param_entries:
-        title = entry.find("title").text
-        published = entry.find("published").text
-        link = entry.find("link")["href"]
-        
-        # Parse entry date with error handling for different timezone formats
+            return None
+
+    if filter_by == "date":
         try:
-            entry_date = datetime.strptime(published, "%Y-%m-%dT%H:%M:%S%z")
-        except ValueError:
-            # Try alternative format without timezone
-            try:
-                entry_date = datetime.strptime(published, "%Y-%m-%dT%H:%M:%S")
-            except ValueError:
-                # Skip this entry if we can't parse the date
-                continue
-        
-        # Extract duration from media:group if available
-        duration_seconds = None
-        media_group = entry.find("media:group")
-        if media_group:
-            media_content = media_group.find("media:content")
-            if media_content and media_content.get("duration"):
-                duration_seconds = int(media_content.get("duration"))
-        
-        # Apply duration filters (only if duration information is available)
-        if duration_seconds is not None:
-            if min_duration is not None and duration_seconds < min_duration:
-                continue
-            if max_duration is not None and duration_seconds > max_duration:
-                continue
+            filter_date = datetime.strptime(filter_value, "%Y-%m-%d").date().isoformat()
+        except (TypeError, ValueError):
+            print(f"Error: Invalid date format for --filter_value: {filter_value}")
+            print("Suggestion: Use YYYY-MM-DD format (e.g., 2023-10-01)")
+            return None
+
+    # Lowercase the title keyword once instead of for every entry
+    title_keyword = filter_value.lower() if filter_by == "title" and filter_value else None
+
+    def _match(title: str, published: str, link: str, duration_seconds: int | None) -> dict[str, str] | None:
+        # Filters are applied cheapest first, so rejected entries skip the title search
+        # The date part of the ISO timestamp is all the filters need
+        if not _PUBLISHED_DATE_RE.match(published):
+            # Skip this entry if the published date isn't an ISO timestamp
+            return None
+        entry_date = published[:10]
         
         # Apply date range filters (AND logic)
-        if after_dt:
+        if after_day:
             # For after filter, we want videos published strictly after the date (> comparison)
             # But since we're comparing dates (not datetime), videos on after_date itself should be included
-            if entry_date.date() < after_dt:
-                continue
-        if before_dt:
+            if entry_date < after_day:
+                return None
+        if before_day:
             # For before filter, we want videos published strictly before the date
             # Videos on before_date itself should be excluded
-            if entry_date.date() >= before_dt:
-                continue
+            if entry_date >= before_day:
+                return None
 
         # Apply legacy date filter (exact match)
-        if filter_by == "date":
-            try:
-                filter_date = datetime.strptime(filter_value, "%Y-%m-%d")
-                if entry_date.date() != filter_date.date():
-                    continue
-            except ValueError:
-                print(f"Error: Invalid date format for --filter_value: {filter_value}")
-                print("Suggestion: Use YYYY-MM-DD format (e.g., 2023-10-01)")
-                return []
+        if filter_date and entry_date != filter_date:
+            return None
+        
+        # Apply duration filters (only if duration information is available)
+        if duration_seconds is not None:
+            if min_duration is not None and duration_seconds < min_duration:
+                return None
+            if max_duration is not None and duration_seconds > max_duration:
+                return None
         
         # Apply title filter (AND logic with date filters)
-        if filter_by == "title":
-            if filter_value.lower() not in title.lower():
-                continue
+        if title_keyword is not None and title_keyword not in title.lower():
+            return None
         
         # If we made it here, the video passed all filters
         video_info = {"title": title, "published": published, "link": link}
@@ -443,36 +827,340 @@ def filter_videos(
                 video_info["duration"] = f"{hours}:{minutes:02d}:{seconds:02d}"
             else:
                 video_info["duration"] = f"{minutes}:{seconds:02d}"
-        
-        filtered_videos.append(video_info)
-    
+        return video_info
+
+    return _match
+
+
+def filter_videos(
+    param_entries: list[dict | BeautifulSoup],
+    filter_by: str | None = None,
+    filter_value: str | None = None,
+    after_date: str | None = None,
+    before_date: str | None = None,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+    include_duration: bool = False,
+) -> list[dict[str, str]]:
+    """
+    Filters videos by date, title, duration, or other metadata.
+    Multiple filters are combined using AND logic.
+
+    Args:
+        param_entries (list): The entries returned by `fetch_rss_feed_content`, or
+            BeautifulSoup 'entry' elements.
+        filter_by (str, optional): The criteria to filter videos by ('date' or 'title').
+        filter_value (str, optional): The value to filter videos by. Defaults to None.
+        after_date (str, optional): Filter videos published after this date (YYYY-MM-DD).
+        before_date (str, optional): Filter videos published before this date (YYYY-MM-DD).
+        min_duration (int, optional): Filter videos with minimum duration in seconds.
+        max_duration (int, optional): Filter videos with maximum duration in seconds.
+        include_duration (bool): Whether to include duration in the output.
+
+    Returns:
+        list: A list of dictionaries containing filtered video details.
+    """
+    match_video = _make_video_filter(
+        filter_by, filter_value, after_date, before_date, min_duration, max_duration, include_duration
+    )
+    if match_video is None:
+        return []
+
+    filtered_videos = []
+    for entry in param_entries:
+        video_info = match_video(*_entry_fields(entry))
+        if video_info is not None:
+            filtered_videos.append(video_info)
     return filtered_videos
 
 
-def format_output(videos: list[dict[str, str]], output_format: str = "text") -> None:
+def stream_filtered_videos(
+    feed_url: str,
+    limit: int = 5,
+    filter_by: str | None = None,
+    filter_value: str | None = None,
+    after_date: str | None = None,
+    before_date: str | None = None,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+    include_duration: bool = False,
+) -> Iterator[dict[str, str]] | None:
+    """
+    Fetches the RSS feed and filters its latest videos in a single streaming pass.
+
+    Each entry is filtered as soon as it is parsed, so videos that don't pass the
+    filters are never collected. The feed is requested immediately; parsing and
+    filtering happen lazily as the returned iterator is consumed.
+
+    Args:
+        feed_url (str): The URL of the RSS feed.
+        limit (int, optional): The maximum number of videos to fetch. Defaults to 5.
+        The remaining arguments are the filters, see `filter_videos`.
+
+    Returns:
+        Iterator: The details of each video that passes the filters.
+        None: If there is an error fetching the RSS feed.
+    """
+    match_video = _make_video_filter(
+        filter_by, filter_value, after_date, before_date, min_duration, max_duration, include_duration
+    )
+    if match_video is None:
+        return iter(())
+
+    response = _open_rss_feed(feed_url)
+    if response is None:
+        return None
+
+    def _stream():
+        with response:
+            try:
+                for values in _iter_feed_entries(response.raw, limit):
+                    video_info = match_video(*values)
+                    if video_info is not None:
+                        yield video_info
+            except ET.ParseError as e:
+                print(f"Error: Could not parse RSS feed: {e}")
+
+    return _stream()
+
+
+def _format_video_text(video: dict[str, str]) -> str:
+    """
+    Format a single video for the text output format.
+
+    Args:
+        video (dict): The video details.
+
+    Returns:
+        str: The video details, one per line, followed by a blank line.
+    """
+    lines = [f"Title: {video['title']}", f"Published: {video['published']}"]
+    if 'channel' in video:
+        lines.insert(0, f"Channel: {video['channel']}")
+    if 'duration' in video:
+        lines.append(f"Duration: {video['duration']}")
+    lines.append(f"Link: {video['link']}\n\n")
+    return "\n".join(lines)
+
+
+def format_output(videos: Iterable[dict[str, str]], output_format: str = "text") -> None:
     """
     Format and display videos in the specified output format.
 
+    The output is built up front and written to stdout in a single call.
+
     Args:
-        videos (list): A list of dictionaries containing video details.
+        videos (Iterable): The dictionaries containing video details, e.g. a list or
+            the iterator returned by `stream_filtered_videos`.
         output_format (str): The output format ('text', 'json', or 'csv').
     """
     if output_format == "json":
-        print(json.dumps(videos, indent=2))
+        data = _json_dumps(list(videos)) + b"\n"
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if stdout_buffer is not None:
+            # Write the encoded JSON directly, after anything already printed
+            sys.stdout.flush()
+            stdout_buffer.write(data)
+            stdout_buffer.flush()
+        else:
+            sys.stdout.write(data.decode("utf-8"))
     elif output_format == "csv":
-        if videos:
+        videos = iter(videos)
+        first_video = next(videos, None)
+        if first_video is not None:
+            import csv
+
+            output = io.StringIO()
             # Dynamically determine CSV headers based on keys in first video
-            fieldnames = list(videos[0].keys())
-            writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames)
+            fieldnames = list(first_video.keys())
+            writer = csv.DictWriter(output, fieldnames=fieldnames)
             writer.writeheader()
+            writer.writerow(first_video)
             writer.writerows(videos)
+            sys.stdout.write(output.getvalue())
     else:  # text format (default)
-        for video in videos:
-            print(f"Title: {video['title']}")
-            print(f"Published: {video['published']}")
-            if 'duration' in video:
-                print(f"Duration: {video['duration']}")
-            print(f"Link: {video['link']}\n")
+        sys.stdout.write("".join(_format_video_text(video) for video in videos))
+
+
+def export_rss_feed_url(rss_feed_url: str, save_url: str | None = None, quiet: bool = False) -> None:
+    """
+    Save the RSS feed URL to a file, or copy it to the clipboard.
+
+    Args:
+        rss_feed_url (str): The RSS feed URL, or several URLs separated by newlines.
+        save_url (str, optional): The file to save the URL to. Copies to the clipboard if not set.
+        quiet (bool): Whether to suppress the confirmation message.
+    """
+    if save_url:
+        try:
+            with open(save_url, "w", encoding="utf-8") as f:
+                f.write(rss_feed_url)
+            if not quiet:
+                print(f"RSS feed URL has been saved to {save_url}")
+        except IOError as e:
+            print(f"Error saving URL to file: {e}")
+    else:
+        import pyperclip
+
+        pyperclip.copy(rss_feed_url)  # Copy RSS feed URL to clipboard
+        if not quiet:
+            print("RSS feed URL has been copied to the clipboard.")
+
+
+# Number of URLs from --urls-file that are processed at the same time
+URLS_FILE_WORKERS = 8
+
+
+def read_urls_file(path: str) -> list[str]:
+    """
+    Read YouTube channel URLs from a file, one per line.
+
+    Blank lines and lines starting with '#' are skipped.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        list: The YouTube channel URLs.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def process_one_url(
+    youtube_url: str | None, args: argparse.Namespace
+) -> tuple[str, str | None, str | None]:
+    """
+    Find the channel ID and RSS feed URL of a YouTube channel.
+
+    This is the pipeline run for the youtube_url argument and for each URL of
+    --urls-file. Errors from fetching the page are printed as they happen; the
+    caller reports the outcome from the returned source.
+
+    Args:
+        youtube_url (str | None): The YouTube channel URL, or None if --channel-id is given.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        tuple: The source of the channel ID, the channel ID and the RSS feed URL. The
+            source is 'provided' (--channel-id), 'url' (read from a /channel/ URL),
+            'cached' or 'fetched' if the channel ID was found, and 'negative' (cached as
+            having no channel ID), 'fetch_failed' or 'not_found' if it wasn't, in which
+            case the channel ID and RSS feed URL are None.
+    """
+    use_cache = not args.no_cache
+    source = "provided"
+    channel_id = args.channel_id
+    if not channel_id:
+        # /channel/UC... URLs contain the channel ID, so there is nothing to fetch or cache
+        source = "url"
+        channel_id = get_channel_id_from_url(youtube_url)
+    if not channel_id:
+        source = "cached"
+        channel_id = get_cached_channel_id(youtube_url, use_cache, args.cache_ttl_days)
+        if channel_id is NEGATIVE:
+            return "negative", None, None
+    if not channel_id:
+        source = "fetched"
+        source_code = get_youtube_source_code(youtube_url)
+        if not source_code:
+            return "fetch_failed", None, None
+        channel_id = get_youtube_channel_id(source_code)
+        # Cache the channel ID (or its absence) for future use
+        if use_cache:
+            cache_channel_id(youtube_url, channel_id)
+        if not channel_id:
+            return "not_found", None, None
+
+    return source, channel_id, create_rss_feed_url(channel_id)
+
+
+def _stream_videos(rss_feed_url: str, args: argparse.Namespace) -> Iterator[dict[str, str]] | None:
+    """
+    Fetch the RSS feed and filter its videos with the command-line options, in one pass.
+
+    Args:
+        rss_feed_url (str): The URL of the RSS feed.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        Iterator: The filtered videos, see `stream_filtered_videos`, or None if the RSS
+            feed could not be fetched.
+    """
+    return stream_filtered_videos(
+        rss_feed_url,
+        args.limit,
+        args.filter_by,
+        args.filter_value,
+        args.after,
+        args.before,
+        args.min_duration,
+        args.max_duration,
+        args.show_duration,
+    )
+
+
+def run_urls_file(youtube_urls: list[str], args: argparse.Namespace) -> bool:
+    """
+    Process several YouTube channel URLs in parallel and display their videos together.
+
+    The URLs are processed by a thread pool over the shared HTTP session. The
+    results are reported in the order of `youtube_urls`, and every video is
+    tagged with the 'channel' URL it came from.
+
+    Args:
+        youtube_urls (list): The YouTube channel URLs.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        bool: True if every URL was processed successfully, False otherwise.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def process(youtube_url: str) -> tuple[str, str | None, list[dict[str, str]] | None]:
+        source, _, rss_feed_url = process_one_url(youtube_url, args)
+        if rss_feed_url is None or args.dry_run:
+            return source, rss_feed_url, None
+        # Read the whole feed in the worker, so that the feeds are fetched in parallel
+        videos = _stream_videos(rss_feed_url, args)
+        return source, rss_feed_url, list(videos) if videos is not None else None
+
+    with ThreadPoolExecutor(max_workers=URLS_FILE_WORKERS) as executor:
+        results = list(executor.map(process, youtube_urls))
+
+    success = True
+    rss_feed_urls = []
+    all_videos = []
+    for youtube_url, (source, rss_feed_url, videos) in zip(youtube_urls, results):
+        if source == "fetch_failed":
+            print(f"Error: Could not fetch YouTube page content for {youtube_url}")
+            success = False
+            continue
+        if rss_feed_url is None:
+            print(f"Error: Channel ID not found for {youtube_url}")
+            success = False
+            continue
+        rss_feed_urls.append(rss_feed_url)
+        if not args.quiet:
+            print(f"RSS Feed URL for {youtube_url}: {rss_feed_url}")
+        if args.dry_run:
+            continue
+        if videos is None:
+            print(f"Could not fetch RSS feed content for {youtube_url}")
+            success = False
+            continue
+        all_videos.extend({"channel": youtube_url, **video} for video in videos)
+
+    if args.dry_run:
+        print("\n--- DRY RUN MODE ---")
+        print(f"Would fetch up to {args.limit} videos from each of {len(rss_feed_urls)} RSS feeds")
+        print("--- END DRY RUN ---")
+        return success
+
+    if rss_feed_urls:
+        export_rss_feed_url("\n".join(rss_feed_urls), args.save_url, args.quiet)
+    format_output(all_videos, args.output)
+    return success
 
 
 if __name__ == "__main__":
@@ -555,6 +1243,13 @@ if __name__ == "__main__":
         help="Filter videos published before this date (YYYY-MM-DD format)",
     )
 
+    # Add optional argument for processing several URLs from a file
+    parser.add_argument(
+        "--urls-file",
+        metavar="FILE",
+        help="Process the YouTube channel URLs listed in FILE (one per line) in parallel",
+    )
+
     # Add optional argument for direct channel ID
     parser.add_argument(
         "--channel-id",
@@ -576,6 +1271,15 @@ if __name__ == "__main__":
         help="Disable channel ID caching",
     )
 
+    # Add optional argument for cache expiry
+    parser.add_argument(
+        "--cache-ttl-days",
+        type=int,
+        default=DEFAULT_CACHE_TTL_DAYS,
+        metavar="DAYS",
+        help=f"Refetch cached channel IDs older than this many days (default: {DEFAULT_CACHE_TTL_DAYS})",
+    )
+
     # Add optional argument to clear cache
     parser.add_argument(
         "--clear-cache",
@@ -610,104 +1314,80 @@ if __name__ == "__main__":
         clear_cache()
         sys.exit(0)
 
-    # Validate that either youtube_url or --channel-id is provided
-    if not args.youtube_url and not args.channel_id:
-        parser.error("Either youtube_url or --channel-id must be provided")
+    # Validate that exactly one of youtube_url, --channel-id or --urls-file is provided
+    if args.urls_file and (args.youtube_url or args.channel_id):
+        parser.error("--urls-file can't be combined with youtube_url or --channel-id")
+    if not args.youtube_url and not args.channel_id and not args.urls_file:
+        parser.error("Either youtube_url, --channel-id or --urls-file must be provided")
 
-    # Extract YouTube URL from parsed arguments
-    youtube_url = args.youtube_url
+    # Reject malformed URLs before any network I/O
+    if args.youtube_url and not is_youtube_channel_url(args.youtube_url):
+        parser.error(f"not a recognized YouTube channel URL: {args.youtube_url}")
+
+    # Process all URLs from the file in parallel
+    if args.urls_file:
+        try:
+            youtube_urls = read_urls_file(args.urls_file)
+        except IOError as e:
+            parser.error(f"Could not read --urls-file: {e}")
+        for url in youtube_urls:
+            if not is_youtube_channel_url(url):
+                parser.error(f"not a recognized YouTube channel URL in --urls-file: {url}")
+        sys.exit(0 if run_urls_file(youtube_urls, args) else 1)
+
+    # Find the channel ID
+    source, channel_id, rss_feed_url = process_one_url(args.youtube_url, args)
     quiet_mode = args.quiet
 
-    # Determine channel ID
-    channel_id = None
-    if args.channel_id:
-        # Use directly provided channel ID
-        channel_id = args.channel_id
-        if not quiet_mode:
-            print(f"Using provided channel ID: {channel_id}")
+    if source == "negative":
+        print("Error: Channel ID not found in the YouTube page (cached result).")
+        print("Suggestion: Check the URL, or use --no-cache to fetch the page again.")
+        sys.exit(1)
+    elif source == "fetch_failed":
+        print("Error: Could not fetch YouTube page content.")
+        print("Suggestion: Check the URL format (e.g., https://www.youtube.com/channel/CHANNEL_ID)")
+        sys.exit(1)
+    elif source == "not_found":
+        print("Error: Channel ID not found in the YouTube page.")
+        print("Suggestion: The URL might be invalid or the page structure has changed.")
+        sys.exit(1)
     else:
-        # Check cache first
-        use_cache = not args.no_cache
-        channel_id = get_cached_channel_id(youtube_url, use_cache)
-        
-        if channel_id:
-            if not quiet_mode:
+        if not quiet_mode:
+            if source == "provided":
+                print(f"Using provided channel ID: {channel_id}")
+            elif source == "url":
+                print(f"Using channel ID from URL: {channel_id}")
+            elif source == "cached":
                 print(f"Using cached channel ID: {channel_id}")
-        else:
-            # Fetch the source code of the YouTube page
-            source_code = get_youtube_source_code(youtube_url)
-            if source_code:
-                # Extract the channel ID from the source code
-                channel_id = get_youtube_channel_id(source_code)
-                # Cache the channel ID for future use
-                if channel_id and use_cache:
-                    cache_channel_id(youtube_url, channel_id)
-            else:
-                print("Error: Could not fetch YouTube page content.")
-                print("Suggestion: Check the URL format (e.g., https://www.youtube.com/channel/CHANNEL_ID)")
-                sys.exit(1)
-
-    if channel_id:
-        # Create the RSS feed URL using the channel ID
-        rss_feed_url = create_rss_feed_url(channel_id)
-        if rss_feed_url:
-            if not quiet_mode:
-                print(f"Channel ID: {channel_id}")
-                print(f"RSS Feed URL: {rss_feed_url}")
-            
-            # Dry run mode - show what would be fetched and exit
-            if args.dry_run:
-                print("\n--- DRY RUN MODE ---")
-                print(f"Would fetch up to {args.limit} videos from RSS feed")
-                if args.filter_by:
-                    print(f"Would filter by {args.filter_by}: {args.filter_value}")
-                if args.after:
-                    print(f"Would filter videos after: {args.after}")
-                if args.before:
-                    print(f"Would filter videos before: {args.before}")
-                if args.output != "text":
-                    print(f"Would output in {args.output} format")
-                if args.save_url:
-                    print(f"Would save RSS URL to: {args.save_url}")
-                else:
-                    print("Would copy RSS URL to clipboard")
-                print("--- END DRY RUN ---")
-                sys.exit(0)
-            
-            # Save URL to file or clipboard
+            print(f"Channel ID: {channel_id}")
+            print(f"RSS Feed URL: {rss_feed_url}")
+
+        # Dry run mode - show what would be fetched and exit
+        if args.dry_run:
+            print("\n--- DRY RUN MODE ---")
+            print(f"Would fetch up to {args.limit} videos from RSS feed")
+            if args.filter_by:
+                print(f"Would filter by {args.filter_by}: {args.filter_value}")
+            if args.after:
+                print(f"Would filter videos after: {args.after}")
+            if args.before:
+                print(f"Would filter videos before: {args.before}")
+            if args.output != "text":
+                print(f"Would output in {args.output} format")
             if args.save_url:
-                try:
-                    with open(args.save_url, "w", encoding="utf-8") as f:
-                        f.write(rss_feed_url)
-                    if not quiet_mode:
-                        print(f"RSS feed URL has been saved to {args.save_url}")
-                except IOError as e:
-                    print(f"Error saving URL to file: {e}")
-            else:
-                pyperclip.copy(rss_feed_url)  # Copy RSS feed URL to clipboard
-                if not quiet_mode:
-                    print("RSS feed URL has been copied to the clipboard.")
-
-            # Fetch and parse the RSS feed content
-            entries = fetch_rss_feed_content(rss_feed_url, limit=args.limit)
-            if entries:
-                # Filter videos based on provided criteria
-                videos = filter_videos(
-                    entries, 
-                    args.filter_by, 
-                    args.filter_value,
-                    args.after,
-                    args.before,
-                    args.min_duration,
-                    args.max_duration,
-                    args.show_duration,
-                )
-                # Format and display videos
-                format_output(videos, args.output)
+                print(f"Would save RSS URL to: {args.save_url}")
             else:
-                print("Could not fetch RSS feed content.")
+                print("Would copy RSS URL to clipboard")
+            print("--- END DRY RUN ---")
+            sys.exit(0)
+
+        # Save URL to file or clipboard
+        export_rss_feed_url(rss_feed_url, args.save_url, quiet_mode)
+
+        # Fetch the RSS feed and filter videos based on provided criteria in one pass
+        videos = _stream_videos(rss_feed_url, args)
+        if videos is not None:
+            # Format and display videos
+            format_output(videos, args.output)
         else:
-            print("Error: Could not create RSS feed URL from channel ID.")
-    else:
-        print("Error: Channel ID not found in the YouTube page.")
-        print("Suggestion: The URL might be invalid or the page structure has changed.")
+            print("Could not fetch RSS feed content.")
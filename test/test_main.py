@@ -1,39 +1,65 @@
+import io
+import os
 from unittest.mock import patch, mock_open
 from bs4 import BeautifulSoup
+import pytest
 import requests
 import json
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
 
+import main
 from main import (
+    get_channel_id_from_url,
+    is_youtube_channel_url,
     get_youtube_source_code,
     get_youtube_channel_id,
     create_rss_feed_url,
     fetch_rss_feed_content,
     filter_videos,
+    stream_filtered_videos,
     format_output,
     get_cached_channel_id,
+    cache_channel_id,
     load_cache,
+    save_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path):
+    """
+    Give every test an empty in-process cache and a temporary home directory, so
+    that no test reads or writes the real cache file and cached lookups don't leak
+    between tests.
+    """
+    with patch("pathlib.Path.home", return_value=tmp_path), \
+            patch.object(main, "_CACHE", None), \
+            patch.object(main, "_CACHE_DIRTY", False), \
+            patch.object(main, "_LAST_HIT", [None] * main.LAST_HIT_SLOTS):
+        yield
+
+
 def test_get_youtube_source_code_success():
     """
     Test case for successfully retrieving YouTube source code.
 
-    This test mocks the `requests.get` method to simulate a successful HTTP GET request
+    This test mocks the shared session's `get` method to simulate a successful HTTP GET request
     to a YouTube channel URL. It verifies that the `get_youtube_source_code` function
     returns the expected HTML content when the request is successful.
 
     Steps:
     1. Define the YouTube channel URL.
     2. Define the expected HTML content to be returned by the mocked request.
-    3. Mock the `requests.get` method to return a successful response with the expected content.
+    3. Mock the shared session's `get` method to return a successful response with the expected content.
     4. Call the `get_youtube_source_code` function with the URL.
     5. Assert that the returned content matches the expected content.
     """
     url = "https://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw"
     expected_content = b"<html>Mocked YouTube Page</html>"
 
-    with patch("requests.get") as mock_get:
+    with patch.object(main._get_session(), "get") as mock_get:
         mock_get.return_value.status_code = 200
         mock_get.return_value.content = expected_content
 
@@ -45,25 +71,43 @@ def test_get_youtube_source_code_failure():
     """
     Test case for handling failure when retrieving YouTube source code.
 
-    This test mocks the `requests.get` method to simulate a failed HTTP GET request
+    This test mocks the shared session's `get` method to simulate a failed HTTP GET request
     to a YouTube channel URL. It verifies that the `get_youtube_source_code` function
     returns None when the request fails.
 
     Steps:
     1. Define the YouTube channel URL.
-    2. Mock the `requests.get` method to raise a `requests.exceptions.RequestException`.
+    2. Mock the shared session's `get` method to raise a `requests.exceptions.RequestException`.
     3. Call the `get_youtube_source_code` function with the URL.
     4. Assert that the returned result is None.
     """
     url = "https://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw"
 
-    with patch("requests.get") as mock_get:
+    with patch.object(main._get_session(), "get") as mock_get:
         mock_get.side_effect = requests.exceptions.RequestException("Mocked Exception")
 
         result = get_youtube_source_code(url)
         assert result is None
 
 
+def test_session_retries_transient_errors():
+    """
+    Test case for the retry policy of the shared HTTP session.
+
+    This test verifies that rate limiting and server errors are retried with backoff
+    and that the final error response is still returned to the caller, for both
+    https:// and http:// URLs.
+    """
+    session = main._get_session()
+    assert session.get_adapter("http://www.youtube.com") is session.get_adapter("https://www.youtube.com")
+    retry = session.get_adapter("https://www.youtube.com").max_retries
+    assert retry.total == 3
+    assert {429, 500, 502, 503, 504} <= set(retry.status_forcelist)
+    assert retry.backoff_factor > 0
+    assert retry.respect_retry_after_header
+    assert not retry.raise_on_status
+
+
 def test_get_youtube_channel_id_meta_tag():
         """
         Test case for extracting YouTube channel ID from a meta tag.
@@ -185,14 +229,14 @@ def test_fetch_rss_feed_content_success():
         """
         Test case for successfully fetching RSS feed content.
 
-        This test mocks the `requests.get` method to simulate a successful HTTP GET request
+        This test mocks the shared session's `get` method to simulate a successful HTTP GET request
         to an RSS feed URL. It verifies that the `fetch_rss_feed_content` function returns
         the expected parsed content when the request is successful.
 
         Steps:
         1. Define the RSS feed URL.
         2. Define the expected RSS feed content to be returned by the mocked request.
-        3. Mock the `requests.get` method to return a successful response with the expected content.
+        3. Mock the shared session's `get` method to return a successful response with the expected content.
         4. Call the `fetch_rss_feed_content` function with the feed URL.
         5. Assert that the returned content is not None.
         6. Assert that the length of the returned content is 2.
@@ -212,35 +256,68 @@ def test_fetch_rss_feed_content_success():
             </entry>
         </feed>"""
 
-        with patch("requests.get") as mock_get:
+        with patch.object(main._get_session(), "get") as mock_get:
             mock_get.return_value.status_code = 200
-            mock_get.return_value.content = expected_content
+            mock_get.return_value.raw = io.BytesIO(expected_content)
 
             result = fetch_rss_feed_content(feed_url)
 
             assert result is not None, "The result should not be None"
             assert len(result) == 2
-            assert result[0].find("title").text == "Video 1"
-            assert result[1].find("title").text == "Video 2"
+            assert result[0]["title"] == "Video 1"
+            assert result[1]["title"] == "Video 2"
+            assert result[1]["link"] == "https://www.youtube.com/watch?v=video2"
+
+
+def test_fetch_rss_feed_content_stops_at_limit():
+    """
+    Test case for fetching a namespaced feed with more entries than the limit.
+
+    This test verifies that `fetch_rss_feed_content` only returns the first `limit`
+    entries and reads the video duration from media:group.
+    """
+    feed_url = "https://www.youtube.com/feeds/videos.xml?channel_id=UC_x5XG1OV2P6uZZ5FSM9Ttw"
+    entries = "".join(
+        f"""<entry>
+            <title>Video {i}</title>
+            <published>2023-10-0{i}T00:00:00+00:00</published>
+            <link rel="alternate" href="https://www.youtube.com/watch?v=video{i}"/>
+            <media:group><media:content duration="{i * 60}"/></media:group>
+        </entry>"""
+        for i in range(1, 6)
+    )
+    expected_content = (
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:media="http://search.yahoo.com/mrss/">'
+        f"{entries}</feed>"
+    ).encode()
+
+    with patch.object(main._get_session(), "get") as mock_get:
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.raw = io.BytesIO(expected_content)
+
+        result = fetch_rss_feed_content(feed_url, limit=2)
+
+    assert [video["title"] for video in result] == ["Video 1", "Video 2"]
+    assert result[1]["duration_seconds"] == 120
 
 
 def test_fetch_rss_feed_content_failure():
         """
         Test case for handling failure when fetching RSS feed content.
 
-        This test mocks the `requests.get` method to simulate a failed HTTP GET request
+        This test mocks the shared session's `get` method to simulate a failed HTTP GET request
         to an RSS feed URL. It verifies that the `fetch_rss_feed_content` function returns
         None when the request fails.
 
         Steps:
         1. Define the RSS feed URL.
-        2. Mock the `requests.get` method to raise a `requests.exceptions.RequestException`.
+        2. Mock the shared session's `get` method to raise a `requests.exceptions.RequestException`.
         3. Call the `fetch_rss_feed_content` function with the feed URL.
         4. Assert that the returned result is None.
         """
         feed_url = "https://www.youtube.com/feeds/videos.xml?channel_id=UC_x5XG1OV2P6uZZ5FSM9Ttw"
 
-        with patch("requests.get") as mock_get:
+        with patch.object(main._get_session(), "get") as mock_get:
             mock_get.side_effect = requests.exceptions.RequestException("Mocked Exception")
 
             result = fetch_rss_feed_content(feed_url)
@@ -374,6 +451,23 @@ def test_filter_videos_with_date_range():
     assert result[0]["title"] == "Video 2"
 
 
+def test_filter_videos_date_without_zero_padding():
+    """
+    Test case for date filters given without zero padding.
+
+    This test verifies that dates like 2023-10-2 are normalized before being compared
+    with the published dates, and that entries without an ISO date are skipped.
+    """
+    entries = [
+        {"title": "Video 1", "published": "2023-10-01T00:00:00+00:00", "link": "https://www.youtube.com/watch?v=video1"},
+        {"title": "Video 2", "published": "2023-10-10T00:00:00+00:00", "link": "https://www.youtube.com/watch?v=video2"},
+        {"title": "Video 3", "published": "yesterday", "link": "https://www.youtube.com/watch?v=video3"},
+    ]
+
+    result = filter_videos(entries, after_date="2023-10-2")
+    assert [video["title"] for video in result] == ["Video 2"]
+
+
 def test_filter_videos_combined_filters():
     """
     Test case for filtering videos with combined filters (title + date range).
@@ -409,6 +503,56 @@ def test_filter_videos_combined_filters():
     assert result[0]["title"] == "Python Advanced"
 
 
+def test_stream_filtered_videos():
+    """
+    Test case for fetching and filtering the RSS feed in a single pass.
+
+    This test verifies that `stream_filtered_videos` only yields the videos that
+    pass the filters, and that the result can be passed to `format_output`.
+    """
+    feed_url = "https://www.youtube.com/feeds/videos.xml?channel_id=UC_x5XG1OV2P6uZZ5FSM9Ttw"
+    content = b"""<feed xmlns="http://www.w3.org/2005/Atom">
+        <entry>
+            <title>Python Tutorial</title>
+            <published>2023-10-01T00:00:00+00:00</published>
+            <link href="https://www.youtube.com/watch?v=video1"/>
+        </entry>
+        <entry>
+            <title>Cooking Show</title>
+            <published>2023-10-02T00:00:00+00:00</published>
+            <link href="https://www.youtube.com/watch?v=video2"/>
+        </entry>
+    </feed>"""
+
+    with patch.object(main._get_session(), "get") as mock_get:
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.raw = io.BytesIO(content)
+
+        result = list(stream_filtered_videos(feed_url, filter_by="title", filter_value="python"))
+
+    assert result == [
+        {
+            "title": "Python Tutorial",
+            "published": "2023-10-01T00:00:00+00:00",
+            "link": "https://www.youtube.com/watch?v=video1",
+        }
+    ]
+
+
+def test_stream_filtered_videos_failure():
+    """
+    Test case for handling failure when fetching the RSS feed to filter.
+
+    This test verifies that `stream_filtered_videos` returns None when the request fails.
+    """
+    feed_url = "https://www.youtube.com/feeds/videos.xml?channel_id=UC_x5XG1OV2P6uZZ5FSM9Ttw"
+
+    with patch.object(main._get_session(), "get") as mock_get:
+        mock_get.side_effect = requests.exceptions.RequestException("Mocked Exception")
+
+        assert stream_filtered_videos(feed_url) is None
+
+
 def test_format_output_text(capsys):
     """
     Test case for formatting video output as text.
@@ -453,6 +597,52 @@ def test_format_output_json(capsys):
     assert output_data[0]["title"] == "Video 1"
 
 
+def test_format_output_json_same_without_orjson():
+    """
+    Test case for the JSON output with and without orjson.
+
+    This test verifies that the encoded JSON is written to the binary stdout buffer
+    in a single call, and that the standard library fallback writes the same bytes
+    as orjson, including non-ASCII characters.
+    """
+    videos = [{"title": "Café – 日本", "published": "2023-10-01T00:00:00+00:00", "link": "https://www.youtube.com/watch?v=1"}]
+
+    outputs = []
+    for json_module in (main.orjson, None):
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        with patch.object(main, "orjson", json_module), patch("sys.stdout", stdout), \
+                patch.object(stdout.buffer, "write", wraps=stdout.buffer.write) as mock_write:
+            format_output(videos, "json")
+        mock_write.assert_called_once()
+        outputs.append(stdout.buffer.getvalue())
+
+    assert outputs[0] == outputs[1]
+    assert json.loads(outputs[0]) == videos
+    assert "Café – 日本".encode("utf-8") in outputs[0]
+
+
+@pytest.mark.parametrize("output_format", ["text", "csv"])
+def test_format_output_single_write(output_format):
+    """
+    Test case for writing the text and CSV output.
+
+    This test verifies that the whole output for several videos is written to
+    stdout in a single call.
+    """
+    videos = [
+        {"title": f"Video {i}", "published": "2023-10-01T00:00:00+00:00", "link": f"https://www.youtube.com/watch?v={i}"}
+        for i in range(3)
+    ]
+
+    stdout = io.StringIO()
+    with patch("sys.stdout", stdout), patch.object(stdout, "write", wraps=stdout.write) as mock_write:
+        format_output(iter(videos), output_format)
+
+    mock_write.assert_called_once()
+    output = stdout.getvalue()
+    assert all(f"Video {i}" in output for i in range(3))
+
+
 def test_format_output_csv(capsys):
     """
     Test case for formatting video output as CSV.
@@ -483,24 +673,48 @@ def test_cache_operations():
     test_cache = {
         "https://www.youtube.com/@test": {
             "channel_id": "UC_test123",
-            "timestamp": "2023-10-01T00:00:00",
+            "timestamp": datetime.now().isoformat(),
         }
     }
 
-    with patch("builtins.open", mock_open(read_data=json.dumps(test_cache))):
-        with patch("pathlib.Path.exists", return_value=True):
-            cache = load_cache()
-            assert "https://www.youtube.com/@test" in cache
+    with patch("builtins.open", mock_open(read_data=json.dumps(test_cache))), \
+            patch("main.get_cache_file_path", return_value=Path("cache.json")), \
+            patch("pathlib.Path.exists", return_value=True), \
+            patch.object(main, "_CACHE", None):
+        cache = load_cache()
+        assert "https://www.youtube.com/@test" in cache
+
+        # Test get_cached_channel_id
+        channel_id = get_cached_channel_id("https://www.youtube.com/@test", use_cache=True)
+        assert channel_id == "UC_test123"
+
+        # Test with cache disabled
+        channel_id = get_cached_channel_id(
+            "https://www.youtube.com/@test", use_cache=False
+        )
+        assert channel_id is None
+
+
+def test_get_youtube_channel_id_meta_tag_attribute_order():
+    """
+    Test case for a meta tag with its attributes in a different order.
 
-            # Test get_cached_channel_id
-            channel_id = get_cached_channel_id("https://www.youtube.com/@test", use_cache=True)
-            assert channel_id == "UC_test123"
+    This test verifies that `get_youtube_channel_id` still reads the channel ID from
+    the 'og:url' meta tag, and prefers it over a conflicting ID in the script data.
+    """
+    html_source_code = b"""
+    <html>
+        <script>var ytInitialData = {"channelId":"UC_otherchannel123"};</script>
+        <meta content="https://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw" property="og:url">
+    </html>
+    """
+    result = get_youtube_channel_id(html_source_code)
+    assert result == "UC_x5XG1OV2P6uZZ5FSM9Ttw"
 
-            # Test with cache disabled
-            channel_id = get_cached_channel_id(
-                "https://www.youtube.com/@test", use_cache=False
-            )
-            assert channel_id is None
+    result = get_youtube_channel_id(
+        b"<meta content='https://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw' property='og:url'>"
+    )
+    assert result == "UC_x5XG1OV2P6uZZ5FSM9Ttw"
 
 
 def test_get_youtube_channel_id_handle_url():
@@ -518,3 +732,316 @@ def test_get_youtube_channel_id_handle_url():
     """
     result = get_youtube_channel_id(html_source_code)
     assert result == "UC_handletest123"
+
+
+def test_cache_channel_id_flushed_once(tmp_path):
+    """
+    Test case for the in-process cache.
+
+    This test verifies that cached channel IDs are kept in memory and only
+    written to the cache file when the cache is flushed.
+    """
+    cache_file = tmp_path / ".youtuberss" / "cache.json"
+
+    with patch("pathlib.Path.home", return_value=tmp_path), \
+            patch.object(main, "_CACHE", None), \
+            patch.object(main, "_CACHE_DIRTY", False):
+        cache_channel_id("https://www.youtube.com/@first", "UC_first")
+        cache_channel_id("https://www.youtube.com/@second", "UC_second")
+        assert not cache_file.exists()
+        assert get_cached_channel_id("https://www.youtube.com/@first") == "UC_first"
+
+        main._flush_cache()
+        saved = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert saved["https://www.youtube.com/@second"]["channel_id"] == "UC_second"
+
+
+def test_cache_hit_recency_saved(tmp_path):
+    """
+    Test case for saving the recency of cache hits.
+
+    This test verifies that a run which only reads the cache still saves the new
+    order of its entries, so a later run evicts the least recently used URL rather
+    than the least recently written one.
+    """
+    cache_file = tmp_path / ".youtuberss" / "cache.json"
+
+    def new_run():
+        main._CACHE = None
+        main._LAST_HIT[:] = [None] * main.LAST_HIT_SLOTS
+
+    with patch("pathlib.Path.home", return_value=tmp_path), \
+            patch.object(main, "MAX_CACHE_ENTRIES", 2):
+        cache_channel_id("https://www.youtube.com/@a", "UC_a")
+        cache_channel_id("https://www.youtube.com/@b", "UC_b")
+        main._flush_cache()
+
+        new_run()
+        assert get_cached_channel_id("https://www.youtube.com/@a") == "UC_a"
+        main._flush_cache()
+
+        new_run()
+        cache_channel_id("https://www.youtube.com/@c", "UC_c")
+        main._flush_cache()
+
+    saved = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert list(saved) == ["https://www.youtube.com/@a", "https://www.youtube.com/@c"]
+
+
+def test_get_cached_channel_id_expired():
+    """
+    Test case for cache entries older than the TTL.
+
+    This test verifies that expired entries are treated as missing and removed from the cache.
+    """
+    url = "https://www.youtube.com/@test"
+    test_cache = {
+        url: {
+            "channel_id": "UC_test123",
+            "timestamp": (datetime.now() - timedelta(days=31)).isoformat(),
+        }
+    }
+
+    with patch.object(main, "_CACHE", OrderedDict(test_cache)) as cache, \
+            patch.object(main, "_CACHE_DIRTY", False):
+        assert get_cached_channel_id(url, max_age_days=30) is None
+        assert url not in cache
+        assert main._CACHE_DIRTY
+
+
+def test_get_cached_channel_id_legacy_entry_expired():
+    """
+    Test case for legacy cache entries (just the channel ID as a string).
+
+    This test verifies that legacy entries, which have no timestamp, are treated as
+    expired: removed from the cache and not remembered as a recent hit.
+    """
+    url = "https://www.youtube.com/@test"
+
+    with patch.object(main, "_CACHE", OrderedDict({url: "UC_test123"})) as cache, \
+            patch.object(main, "_CACHE_DIRTY", False):
+        assert get_cached_channel_id(url) is None
+        assert url not in cache
+        assert main._CACHE_DIRTY
+        assert get_cached_channel_id(url) is None
+
+
+def test_cache_channel_id_evicts_least_recently_used():
+    """
+    Test case for the bounded cache.
+
+    This test verifies that the least recently used entry is evicted once
+    the cache grows beyond MAX_CACHE_ENTRIES.
+    """
+    with patch.object(main, "_CACHE", OrderedDict()) as cache, \
+            patch.object(main, "_CACHE_DIRTY", False), \
+            patch.object(main, "MAX_CACHE_ENTRIES", 2):
+        cache_channel_id("https://www.youtube.com/@first", "UC_first")
+        cache_channel_id("https://www.youtube.com/@second", "UC_second")
+        # Touch the first entry so the second one becomes least recently used
+        assert get_cached_channel_id("https://www.youtube.com/@first") == "UC_first"
+        cache_channel_id("https://www.youtube.com/@third", "UC_third")
+
+        assert list(cache) == ["https://www.youtube.com/@first", "https://www.youtube.com/@third"]
+
+
+def test_negative_cache_entry():
+    """
+    Test case for caching URLs whose page has no channel ID.
+
+    This test verifies that a cached negative result is reported as NEGATIVE,
+    and expires after NEGATIVE_CACHE_TTL_DAYS.
+    """
+    url = "https://www.youtube.com/@missing"
+
+    stale_url = "https://www.youtube.com/@stale"
+    stale = datetime.now() - timedelta(days=main.NEGATIVE_CACHE_TTL_DAYS + 1)
+    test_cache = OrderedDict(
+        {stale_url: {"channel_id": None, "timestamp": stale.isoformat(), "negative": True}}
+    )
+
+    with patch.object(main, "_CACHE", test_cache), \
+            patch.object(main, "_CACHE_DIRTY", False):
+        cache_channel_id(url, None)
+        assert get_cached_channel_id(url) is main.NEGATIVE
+        assert get_cached_channel_id(stale_url) is None
+
+
+def test_get_cached_channel_id_repeated_lookup():
+    """
+    Test case for repeated lookups of the same URL.
+
+    This test verifies that a repeated hit is answered from the table of recent hits
+    without looking up the entry again, and that re-caching the URL invalidates it.
+    """
+    url = "https://www.youtube.com/@test"
+
+    with patch.object(main, "_CACHE", OrderedDict()):
+        cache_channel_id(url, "UC_test123")
+        assert get_cached_channel_id(url) == "UC_test123"
+
+        with patch("main._get_cache", side_effect=AssertionError("cache entry looked up")):
+            assert get_cached_channel_id(url) == "UC_test123"
+
+        cache_channel_id(url, "UC_test456")
+        assert get_cached_channel_id(url) == "UC_test456"
+
+
+def test_save_cache_keeps_recency_order(tmp_path):
+    """
+    Test case for saving the order of the cache.
+
+    This test verifies that entries moved to the most recently used end are saved
+    in that order, with or without orjson.
+    """
+    cache = OrderedDict((url, {"channel_id": "UC_test", "timestamp": "2023-10-01T00:00:00"}) for url in "abc")
+    cache.move_to_end("a")
+
+    with patch("pathlib.Path.home", return_value=tmp_path):
+        save_cache(cache)
+        assert list(load_cache()) == ["b", "c", "a"]
+        with patch.object(main, "orjson", None):
+            save_cache(cache)
+            assert list(load_cache()) == ["b", "c", "a"]
+
+
+def test_save_cache_compresses_large_cache(tmp_path):
+    """
+    Test case for gzipping caches above CACHE_COMPRESS_THRESHOLD.
+
+    This test verifies that a large cache is written gzipped, replacing the plain
+    cache file, and that it is read back unchanged.
+    """
+    cache = OrderedDict(
+        (f"https://www.youtube.com/@channel{i}", {"channel_id": f"UC_{i}", "timestamp": "2023-10-01T00:00:00"})
+        for i in range(10)
+    )
+    plain_file = tmp_path / ".youtuberss" / "cache.json"
+    plain_file.parent.mkdir()
+    plain_file.write_text("{}", encoding="utf-8")
+
+    with patch("pathlib.Path.home", return_value=tmp_path), \
+            patch.object(main, "CACHE_COMPRESS_THRESHOLD", 100):
+        save_cache(cache)
+        assert (tmp_path / ".youtuberss" / "cache.json.gz").exists()
+        assert not plain_file.exists()
+        assert load_cache() == cache
+
+
+def test_run_urls_file(capsys):
+    """
+    Test case for processing the URLs of --urls-file.
+
+    This test verifies that the videos of every URL are displayed together, in
+    the order of the file, tagged with their channel, and that a failed URL is
+    reported.
+    """
+    video = {"title": "Video", "published": "2023-10-01T00:00:00+00:00", "link": "https://www.youtube.com/watch?v=1"}
+    results = {
+        "https://www.youtube.com/@first": ("cached", "UC_1", "https://www.youtube.com/feeds/videos.xml?channel_id=UC_1"),
+        "https://www.youtube.com/@missing": ("not_found", None, None),
+    }
+    args = main.argparse.Namespace(quiet=True, dry_run=False, save_url="rss.txt", output="text")
+
+    with patch("main.process_one_url", side_effect=lambda url, _args: results[url]), \
+            patch("main._stream_videos", return_value=iter([video])) as mock_stream, \
+            patch("main.export_rss_feed_url") as mock_export:
+        assert not main.run_urls_file(list(results), args)
+
+    output = capsys.readouterr().out
+    assert "Error: Channel ID not found for https://www.youtube.com/@missing" in output
+    assert "Channel: https://www.youtube.com/@first" in output
+    assert "Title: Video" in output
+    mock_stream.assert_called_once_with("https://www.youtube.com/feeds/videos.xml?channel_id=UC_1", args)
+    mock_export.assert_called_once_with("https://www.youtube.com/feeds/videos.xml?channel_id=UC_1", "rss.txt", True)
+
+
+def test_load_cache_prefers_newer_file(tmp_path):
+    """
+    Test case for a save interrupted between writing one cache file and removing the other.
+
+    This test verifies that the newer of the plain and gzipped cache files is loaded.
+    """
+    cache_dir = tmp_path / ".youtuberss"
+    cache_dir.mkdir()
+    stale = {"https://www.youtube.com/@test": {"channel_id": "UC_stale", "timestamp": "2023-10-01T00:00:00"}}
+    current = {"https://www.youtube.com/@test": {"channel_id": "UC_current", "timestamp": "2023-10-02T00:00:00"}}
+    with main.gzip.open(cache_dir / "cache.json.gz", "wb") as f:
+        f.write(json.dumps(stale).encode("utf-8"))
+    (cache_dir / "cache.json").write_text(json.dumps(current), encoding="utf-8")
+    os.utime(cache_dir / "cache.json.gz", (1_000_000, 1_000_000))
+
+    with patch("pathlib.Path.home", return_value=tmp_path):
+        assert load_cache() == current
+
+
+def test_process_one_url_fetches_and_caches():
+    """
+    Test case for processing a @handle URL.
+
+    This test verifies that the channel ID is fetched from the page and cached on
+    the first run, read from the cache on the next one, and that a page without a
+    channel ID is reported as not found.
+    """
+    url = "https://www.youtube.com/@test"
+    args = main.argparse.Namespace(channel_id=None, no_cache=False, cache_ttl_days=30)
+    page = b'<meta property="og:url" content="https://www.youtube.com/channel/UC_test123">'
+
+    with patch("main.get_youtube_source_code", return_value=page) as mock_fetch:
+        assert main.process_one_url(url, args)[:2] == ("fetched", "UC_test123")
+        assert main.process_one_url(url, args)[:2] == ("cached", "UC_test123")
+    mock_fetch.assert_called_once_with(url)
+
+    with patch("main.get_youtube_source_code", return_value=b"<html></html>"):
+        assert main.process_one_url("https://www.youtube.com/@empty", args) == ("not_found", None, None)
+        assert main.process_one_url("https://www.youtube.com/@empty", args) == ("negative", None, None)
+
+
+def test_is_youtube_channel_url():
+    """
+    Test case for validating YouTube channel URLs.
+
+    This test verifies that the supported channel URL forms are accepted and that
+    typos and other domains are rejected.
+    """
+    assert is_youtube_channel_url("https://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw")
+    assert is_youtube_channel_url("https://www.youtube.com/@channelname")
+    assert is_youtube_channel_url("https://youtube.com/c/channelname/")
+    assert is_youtube_channel_url("http://www.youtube.com/user/channelname")
+    assert not is_youtube_channel_url("https://www.youtub.com/@channelname")
+    assert not is_youtube_channel_url("https://www.example.com/@channelname")
+    assert not is_youtube_channel_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+
+
+def test_get_channel_id_from_url():
+    """
+    Test case for reading the channel ID straight from a /channel/ URL.
+
+    This test verifies that /channel/UC... URLs yield their channel ID and that
+    other URL forms yield None.
+    """
+    assert get_channel_id_from_url("https://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw") == "UC_x5XG1OV2P6uZZ5FSM9Ttw"
+    assert get_channel_id_from_url("http://youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw/videos") == "UC_x5XG1OV2P6uZZ5FSM9Ttw"
+    assert get_channel_id_from_url("https://www.youtube.com/@channelname") is None
+
+
+def test_process_one_url_channel_url_skips_fetch():
+    """
+    Test case for processing a /channel/ URL.
+
+    This test verifies that the channel ID is taken from the URL without fetching
+    the page or touching the cache.
+    """
+    url = "https://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw"
+    args = main.argparse.Namespace(channel_id=None, no_cache=False, cache_ttl_days=30)
+
+    with patch("main.get_youtube_source_code") as mock_fetch, \
+            patch("main.get_cached_channel_id") as mock_get_cached, \
+            patch("main.cache_channel_id") as mock_cache:
+        source, channel_id, rss_feed_url = main.process_one_url(url, args)
+
+    assert (source, channel_id) == ("url", "UC_x5XG1OV2P6uZZ5FSM9Ttw")
+    assert rss_feed_url == "https://www.youtube.com/feeds/videos.xml?channel_id=UC_x5XG1OV2P6uZZ5FSM9Ttw"
+    mock_fetch.assert_not_called()
+    mock_get_cached.assert_not_called()
+    mock_cache.assert_not_called()